@@ -0,0 +1,53 @@
+"""
+Ahead-of-Time Kernel Build Script
+
+Compiles the Numba kernels of statistics_calculator.py into a native
+extension module, stats_kernels, placed next to this script. Once it
+exists, statistics_calculator imports it in preference to JIT-compiling
+at import time, so short runs (such as the demo in main) start
+immediately and Numba is not needed to run them.
+
+Requires Numba (numba.pycc) and a C compiler at build time. Usage:
+
+    python build_kernels.py     # or: make kernels
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# Import the JIT definitions even if a previous build is present: a None
+# entry in sys.modules makes `import stats_kernels` raise ImportError
+sys.modules["stats_kernels"] = None
+import statistics_calculator as sc  # noqa: E402
+
+# Element types of the storage widths chosen by _narrowest_int_dtype
+INT_CODES = ("i2", "i4", "i8")
+
+
+def build() -> None:
+    """
+    BUILD FUNCTION: Export Every Kernel for Every Storage Width
+    
+    Each JIT kernel's Python source (py_func) is compiled once per integer
+    width under the name <kernel>_<code>, e.g. mean_i8. The prange kernel
+    cannot be built this way and stays JIT-compiled.
+    """
+    cc = CC("stats_kernels")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    for code in INT_CODES:
+        cc.export(f"summary_{code}", f"Tuple((i8, f8, f8, i8, i8))({code}[:])")(
+            sc._jit_summary.py_func)
+        cc.export(f"mean_{code}", f"f8({code}[:])")(sc._jit_mean.py_func)
+        cc.export(f"median_{code}", f"UniTuple(i8, 2)({code}[:])")(
+            sc._jit_median.py_func)
+        cc.export(f"mode_{code}", f"Tuple((i8[:], i8))({code}[:])")(
+            sc._jit_mode.py_func)
+    
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -17,8 +17,472 @@ Object-Oriented Design Features:
 - Type hints for better code documentation and IDE support
 """
 
-from typing import List, Tuple, Union
+import functools
+import operator
+import sys
 from collections import Counter
+from typing import Callable, Iterable, List, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+# OPTIONAL DEPENDENCY: Numba JIT-compiles the statistical kernels when
+# available; otherwise the equivalent NumPy implementations are used instead
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# OPTIONAL BUILD ARTIFACT: ahead-of-time compiled kernels produced by
+# build_kernels.py (`make kernels`). They replace the four single-threaded
+# JIT kernels so short runs pay no compilation cost, and they do not need
+# Numba at runtime. The prange kernels (_par_summary, _batch_kernel) cannot
+# be built ahead of time and remain JIT-compiled when Numba is installed.
+try:
+    import stats_kernels
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
+
+def _aot_kernel(name: str):
+    """
+    HELPER FUNCTION: Dispatch to an AOT Kernel by Element Type
+    
+    stats_kernels exports one function per storage width, named
+    <name>_i2, <name>_i4 and <name>_i8; this returns a single callable that
+    picks the right one from the array's dtype.
+    """
+    table = {np.dtype(dtype): getattr(stats_kernels, f"{name}_{code}")
+             for dtype, code in ((np.int16, "i2"), (np.int32, "i4"),
+                                 (np.int64, "i8"))}
+    
+    def kernel(a):
+        return table[a.dtype](a)
+    
+    kernel.__name__ = f"_{name}_aot"
+    return kernel
+
+
+if NUMBA_AVAILABLE:
+    # STABLE KERNEL SIGNATURE: the kernels are handed read-only, contiguous
+    # 1-D arrays (see _resolve). The common int64 case is compiled eagerly
+    # at import, after the definitions below; the narrow storage widths
+    # chosen by _narrowest_int_dtype, and the parallel kernels, specialize
+    # lazily on first use. Accumulators are always 64-bit.
+    _INT64_ARRAY = types.Array(types.int64, 1, 'C', readonly=True)
+
+    @njit(cache=True)
+    def _jit_summary(a):
+        """
+        JIT KERNEL: Single-pass summary of an integer array
+        
+        Streams over the buffer once, accumulating the integer sum, the
+        running mean and sum of squared deviations (Welford's update,
+        numerically stable), and the extremes. The sum is int64 and wraps
+        modulo 2**64; callers must check it against the float mean.
+        
+        Returns:
+            Tuple (sum, mean, m2, min, max)
+        """
+        s = 0
+        mean = 0.0
+        m2 = 0.0
+        mn = a[0]
+        mx = a[0]
+        for i in range(a.size):
+            x = a[i]
+            s += x
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+        return s, mean, m2, mn, mx
+
+    # PARALLEL REDUCTION: fixed chunk length for the per-core partial summaries
+    _PAR_CHUNK = 1 << 14
+
+    @njit(parallel=True, cache=True)
+    def _par_summary(a):
+        """
+        JIT KERNEL: Multi-core version of _jit_summary
+        
+        Count, sum, mean, m2, min and max are all decomposable statistics:
+        each chunk is summarised independently (in parallel via prange) and
+        the partial results are merged. Means are combined weighted by chunk
+        size and m2 with the pairwise update of Chan et al. As in _jit_summary,
+        the merged int64 sum wraps modulo 2**64.
+        
+        Returns:
+            Tuple (sum, mean, m2, min, max)
+        """
+        n = a.size
+        nchunks = (n + _PAR_CHUNK - 1) // _PAR_CHUNK
+        sums = np.empty(nchunks, dtype=np.int64)
+        means = np.empty(nchunks, dtype=np.float64)
+        m2s = np.empty(nchunks, dtype=np.float64)
+        mins = np.empty(nchunks, dtype=np.int64)
+        maxs = np.empty(nchunks, dtype=np.int64)
+        for i in prange(nchunks):
+            lo = i * _PAR_CHUNK
+            hi = min(lo + _PAR_CHUNK, n)
+            sums[i], means[i], m2s[i], mins[i], maxs[i] = _jit_summary(a[lo:hi])
+        
+        s = 0
+        mean = 0.0
+        m2 = 0.0
+        count = 0
+        for i in range(nchunks):
+            size = min(_PAR_CHUNK, n - i * _PAR_CHUNK)
+            total = count + size
+            delta = means[i] - mean
+            mean += delta * size / total
+            m2 += m2s[i] + delta * delta * count * size / total
+            s += sums[i]
+            count = total
+        return s, mean, m2, mins.min(), maxs.max()
+
+    @njit(cache=True)
+    def _jit_mean(a):
+        """
+        JIT KERNEL: Arithmetic mean of a non-empty integer array
+        
+        Accumulates in float64 (as ndarray.mean does): an int64 running sum
+        would silently wrap for large values.
+        """
+        s = 0.0
+        for i in range(a.size):
+            s += a[i]
+        return s / a.size
+
+    @njit(cache=True)
+    def _jit_median(a):
+        """
+        JIT KERNEL: Middle value(s) of a non-empty integer array
+        
+        Quickselect (Hoare partitioning, median-of-three pivot) on a copy
+        places the upper middle element at index n // 2; every element
+        before it is then no larger, so the lower middle value is the
+        maximum of that half. Hand-written rather than np.partition, whose
+        Numba implementation takes seconds to compile.
+        
+        Returns:
+            Tuple (lower middle, upper middle); equal for odd sizes. The
+            caller averages them exactly, as float arithmetic here would
+            round each value before their sum.
+        """
+        n = a.size
+        k = n // 2
+        w = a.copy()
+        lo = 0
+        hi = n - 1
+        while lo < hi:
+            x, y, z = w[lo], w[(lo + hi) // 2], w[hi]
+            if x > y:
+                x, y = y, x
+            pivot = max(x, min(y, z))
+            i = lo
+            j = hi
+            while i <= j:
+                while w[i] < pivot:
+                    i += 1
+                while w[j] > pivot:
+                    j -= 1
+                if i <= j:
+                    w[i], w[j] = w[j], w[i]
+                    i += 1
+                    j -= 1
+            if k <= j:
+                hi = j
+            elif k >= i:
+                lo = i
+            else:
+                break
+        if n % 2 == 0:
+            return w[:k].max(), w[k]
+        return w[k], w[k]
+
+    @njit(cache=True)
+    def _jit_mode(a):
+        """
+        JIT KERNEL: Mode(s) of a non-empty, SORTED integer array
+        
+        First pass finds the longest run of equal values; second pass
+        collects the value of every run of that length (already in order).
+        
+        Returns:
+            Tuple (modes, frequency)
+        """
+        n = a.size
+        best = 0
+        run = 1
+        for i in range(1, n + 1):
+            if i < n and a[i] == a[i - 1]:
+                run += 1
+            else:
+                if run > best:
+                    best = run
+                run = 1
+        modes = np.empty(n, dtype=np.int64)
+        k = 0
+        run = 1
+        for i in range(1, n + 1):
+            if i < n and a[i] == a[i - 1]:
+                run += 1
+            else:
+                if run == best:
+                    modes[k] = a[i - 1]
+                    k += 1
+                run = 1
+        return modes[:k], best
+
+    @njit(parallel=True, cache=True)
+    def _batch_kernel(values, offsets, means, medians, modes, nmodes, freqs):
+        """
+        JIT KERNEL: Mean, Median and Mode for Every Dataset of a Ragged Batch
+        
+        values holds all datasets back to back; dataset i is the slice
+        values[offsets[i]:offsets[i + 1]]. Datasets are independent, so they
+        are processed in parallel via prange; each is sorted once and both
+        median and mode are read from it. Results are written into the
+        output arrays: row i of medians holds the two middle values
+        (averaged exactly by the caller), and dataset i's nmodes[i] mode
+        values are written to modes from offsets[i] on (a dataset never has
+        more modes than values). Empty datasets are left untouched.
+        """
+        for i in prange(offsets.size - 1):
+            start = offsets[i]
+            n = offsets[i + 1] - start
+            if n == 0:
+                continue
+            a = np.sort(values[start:start + n])
+            s = 0.0
+            for j in range(n):
+                s += a[j]
+            means[i] = s / n
+            medians[i, 0] = a[(n - 1) // 2]
+            medians[i, 1] = a[n // 2]
+            row_modes, freqs[i] = _jit_mode(a)
+            nmodes[i] = row_modes.size
+            modes[start:start + row_modes.size] = row_modes
+
+    _summary, _mean_impl, _median_impl, _mode_impl = (
+        _jit_summary, _jit_mean, _jit_median, _jit_mode)
+
+    # EAGER COMPILATION: int64 only (loaded from the on-disk cache when
+    # warm), and skipped when the AOT kernels take over these four
+    if not AOT_AVAILABLE:
+        for _kernel in (_summary, _mean_impl, _median_impl, _mode_impl):
+            _kernel.compile((_INT64_ARRAY,))
+        del _kernel
+else:
+    def _summary(a):
+        """
+        FALLBACK KERNEL: NumPy equivalent of the JIT summary kernel
+        
+        The int64 sum wraps modulo 2**64, exactly like the JIT kernel's.
+        
+        Returns:
+            Tuple (sum, mean, m2, min, max)
+        """
+        mean = float(a.mean())
+        deviations = a - mean
+        return (int(a.sum(dtype=np.int64)), mean, float(np.dot(deviations, deviations)),
+                int(a.min()), int(a.max()))
+
+    # NumPy reductions already run in C; there is no multi-core variant
+    _par_summary = _summary
+    _batch_kernel = None
+
+    def _mean_impl(a):
+        """FALLBACK KERNEL: Arithmetic mean of a non-empty integer array"""
+        return float(a.mean())
+
+    def _median_impl(a):
+        """
+        FALLBACK KERNEL: Middle value(s) of a non-empty integer array
+        
+        np.partition places only the k-th element(s) in their final position
+        (O(n) introselect) and works on a copy, leaving the input untouched.
+        
+        Returns:
+            Tuple (lower middle, upper middle); equal for odd sizes
+        """
+        n = a.size
+        part = np.partition(a, [(n - 1) // 2, n // 2])
+        return int(part[(n - 1) // 2]), int(part[n // 2])
+
+    def _mode_impl(a):
+        """
+        FALLBACK KERNEL: Mode(s) of a non-empty, SORTED integer array
+        
+        Equal values are adjacent in sorted data, so run boundaries are where
+        consecutive elements differ (run-length encoding).
+        
+        Returns:
+            Tuple (modes, frequency)
+        """
+        change = np.flatnonzero(np.diff(a) != 0)
+        starts = np.r_[0, change + 1]
+        counts = np.r_[change + 1, a.size] - starts
+        max_frequency = counts.max()
+        return a[starts[counts == max_frequency]], int(max_frequency)
+
+if AOT_AVAILABLE:
+    _summary = _aot_kernel("summary")
+    _mean_impl = _aot_kernel("mean")
+    _median_impl = _aot_kernel("median")
+    _mode_impl = _aot_kernel("mode")
+    
+    # WITHOUT NUMBA: no multi-core variant, the AOT summary serves both
+    if not NUMBA_AVAILABLE:
+        _par_summary = _summary
+
+
+def _as_int64_array(data, copy: bool = False) -> np.ndarray:
+    """
+    HELPER FUNCTION: Validated Conversion to a Contiguous int64 Array
+    
+    Args:
+        data: Sequence or array of integers
+        copy: Guarantee the result does not share memory with data
+        
+    Returns:
+        C-contiguous int64 array holding data
+        
+    Raises:
+        ValueError: If data is not one-dimensional (scalars included), if
+            it is non-empty and not integer-valued (a plain int64 cast would
+            silently truncate floats such as 1.5), or if it holds unsigned
+            values above the int64 range (the cast would wrap them negative)
+    """
+    arr = np.asarray(data)
+    if arr.ndim != 1:
+        raise ValueError(f"Statistics require a 1-D sequence, got {arr.ndim}-D input")
+    if arr.size and arr.dtype.kind not in 'biu':
+        raise ValueError(f"Statistics require integer data, got dtype {arr.dtype}")
+    if (arr.size and arr.dtype.kind == 'u'
+            and arr.max() > np.iinfo(np.int64).max):
+        raise ValueError(f"Value {int(arr.max())} exceeds the int64 range")
+    result = np.ascontiguousarray(arr, dtype=np.int64)
+    # Lists and tuples were already copied by asarray; arrays and buffers
+    # may still be the caller's memory
+    if copy and not isinstance(data, (list, tuple)) and np.may_share_memory(result, arr):
+        result = result.copy()
+    return result
+
+
+def _narrowest_int_dtype(lo: int, hi: int) -> np.dtype:
+    """
+    HELPER FUNCTION: Smallest Integer Storage Type for a Value Range
+    
+    Narrower elements mean fewer bytes moved per reduction (and more SIMD
+    lanes per instruction), so data that fits is stored as int16 or int32.
+    
+    Args:
+        lo: Smallest value in the dataset
+        hi: Largest value in the dataset
+        
+    Returns:
+        np.int16, np.int32 or np.int64
+    """
+    for dtype in (np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return np.int64
+
+
+# STORAGE TYPES: integer widths the kernels are compiled for
+_SUPPORTED_DTYPES = (np.dtype(np.int16), np.dtype(np.int32), np.dtype(np.int64))
+
+
+def _empty_guard(empty_value: Callable[[], object]):
+    """
+    DECORATOR FACTORY: Shared Empty-Data Handling
+    
+    Wraps a private array helper, fn(self, arr, ...), written against a
+    non-empty array. The wrapper returns a fresh empty_value() when arr is
+    empty and otherwise calls through, so every public method that resolves
+    its input (see StatisticsCalculator._resolve) and forwards the array
+    gets the same empty-data behavior.
+    
+    Args:
+        empty_value: Zero-argument factory for the empty-data result (a
+            factory, so mutable results are never shared between calls)
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, arr: np.ndarray, *args):
+            if arr.size == 0:
+                return empty_value()
+            return fn(self, arr, *args)
+        return wrapper
+    return decorator
+
+
+def _mode_tuple(modes: np.ndarray) -> Tuple[int, ...]:
+    """
+    HELPER FUNCTION: Immutable Mode Values as Python ints
+    
+    The common single-mode case builds a one-element tuple directly,
+    skipping the intermediate list.
+    """
+    if modes.size == 1:
+        return (int(modes[0]),)
+    return tuple(modes.tolist())
+
+
+def _instance_cache(key: str, copy: Callable[[object], object] = None):
+    """
+    DECORATOR FACTORY: Memoize a Helper's Result for the Instance Data
+    
+    Applies to helpers called as fn(self, arr, ...). When arr is the
+    instance's own array, the result is stored in self._cache under key
+    (cleared by set_data) and later calls return it without recomputing.
+    Calls on external data are never cached, and neither are buffer-backed
+    instances (no sorted copy): their buffer may change under them.
+    
+    Args:
+        key: Cache slot name
+        copy: Optional function applied to the cached value on every
+            return, so callers never receive a shared mutable object
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, arr, *args):
+            if arr is not self._data_arr or self._sorted_arr is None:
+                return fn(self, arr, *args)
+            if key not in self._cache:
+                self._cache[key] = fn(self, arr, *args)
+            value = self._cache[key]
+            return copy(value) if copy is not None else value
+        return wrapper
+    return decorator
+
+
+class Stats(NamedTuple):
+    """
+    VALUE OBJECT: Immutable Result of calculate_all_statistics
+    
+    A fixed-layout tuple subclass: fields are read by position rather than
+    by hashing string keys, and instances carry no per-object __dict__.
+    
+    Attributes:
+        mean (float): Arithmetic mean
+        median (float): Median value
+        modes (tuple): Mode value(s) in ascending order
+        freq (int): Frequency of the mode(s)
+        size (int): Number of values in the dataset
+    """
+    mean: float
+    median: float
+    modes: tuple
+    freq: int
+    size: int
 
 
 class StatisticsCalculator:
@@ -26,25 +490,53 @@ class StatisticsCalculator:
     OBJECT-ORIENTED CLASS: Statistics Calculator
     
     Demonstrates key OOP principles:
-    - ENCAPSULATION: Data (self._data) and methods are bundled together
+    - ENCAPSULATION: Data (self._data_arr) and methods are bundled together
     - ABSTRACTION: Complex statistical algorithms hidden behind simple method interfaces
-    - DATA HIDING: Internal data stored as private attribute (self._data)
+    - DATA HIDING: Internal data stored as private, read-only array (self._data_arr)
     - INTERFACE DESIGN: Clear, consistent method signatures
     
     This class provides a reusable, maintainable solution for statistical calculations
     while demonstrating object-oriented design patterns and Python best practices.
     
     Attributes:
-        _data (List[int]): Private instance variable storing the dataset
+        _data_arr (np.ndarray): Private, read-only integer array storing the
+            dataset in a contiguous buffer for vectorized reductions; the
+            element type is the narrowest of int16/int32/int64 that fits
+        _sorted_arr (np.ndarray): Sorted copy of _data_arr, built once so
+            median and mode queries on instance data avoid re-sorting; None
+            for buffer-backed instances (see from_buffer)
+        _cache (dict): Results already computed for the instance data,
+            keyed by statistic name; reset whenever the data changes and
+            never used by buffer-backed instances
+        PARALLEL_THRESHOLD (int): Array size above which the summary is
+            computed by the multi-core kernel
+        BINCOUNT_MAX_RANGE (int): Largest value range (max - min) for which
+            unsorted data is counted with a histogram instead of a sort
+        REPORT_TEMPLATE, EMPTY_REPORT_TEMPLATE, SINGLE_MODE_TEMPLATE,
+        MULTI_MODE_TEMPLATE (str): Output layouts used by print_statistics
     """
     
+    # FIXED INSTANCE LAYOUT: no per-instance __dict__; attributes live in
+    # slots, which makes instances smaller and attribute access cheaper
+    __slots__ = ('_data_arr', '_sorted_arr', '_cache')
+    
+    # CLASS ATTRIBUTES: shared tuning constants for all instances
+    PARALLEL_THRESHOLD = 1 << 16
+    BINCOUNT_MAX_RANGE = 1_000_000
+    
+    # OUTPUT TEMPLATES: each report is rendered in full and written once
+    REPORT_TEMPLATE = "Array: {data}\nMean: {mean:.2f}\nMedian: {median:.2f}\nMode: {mode}\n\n"
+    EMPTY_REPORT_TEMPLATE = "Array: {data}\nCannot calculate statistics for empty array.\n\n"
+    SINGLE_MODE_TEMPLATE = "{mode} (frequency: {freq})"
+    MULTI_MODE_TEMPLATE = "{modes} (frequency: {freq} each)"
+    
     def __init__(self, data: List[int] = None):
         """
         CONSTRUCTOR METHOD: Object Initialization
         
         Demonstrates OOP initialization patterns:
         - Optional parameter with default value
-        - Instance variable initialization
+        - Instance variable initialization (delegated to the setter)
         - Type hints for parameter documentation
         
         Args:
@@ -52,9 +544,8 @@ class StatisticsCalculator:
             
         OOP Principle: ENCAPSULATION - bundles data with methods that operate on it
         """
-        # PRIVATE INSTANCE VARIABLE (encapsulation principle)
-        # Using underscore convention to indicate internal/private data
-        self._data = data if data is not None else []
+        # SINGLE POINT OF STATE CHANGE: the setter owns all internal storage
+        self.set_data(data if data is not None else [])
     
     def set_data(self, data: List[int]) -> None:
         """
@@ -63,32 +554,107 @@ class StatisticsCalculator:
         Demonstrates OOP data management:
         - Controlled access to internal data
         - Input validation and data protection
-        - Defensive copying to prevent external modifications
+        - One copy on write, after which the data is frozen
         
         Args:
             data: List of integers to set as the calculator's dataset
             
+        Raises:
+            ValueError: If data is not integer-valued
+            
         OOP Principle: DATA HIDING - controls how internal data is modified
         """
-        # DEFENSIVE COPYING (OOP best practice for data protection)
-        self._data = data.copy()  # Create a copy to avoid external modifications
+        # COPY-ON-WRITE: copy once here, then mark the buffer read-only so
+        # getters can share it without further defensive copies
+        arr = _as_int64_array(data, copy=True)
+        
+        # QUANTIZATION: store in the narrowest integer type the range allows
+        if arr.size:
+            arr = arr.astype(_narrowest_int_dtype(arr.min(), arr.max()),
+                             copy=False)
+        self._data_arr = arr
+        self._data_arr.flags.writeable = False
+        
+        # SORT ONCE, ANSWER MANY: amortizes ordering work across queries
+        self._sorted_arr = np.sort(self._data_arr)
+        self._sorted_arr.flags.writeable = False
+        
+        # CACHE INVALIDATION: results for the previous data are stale
+        self._cache = {}
+    
+    @classmethod
+    def from_buffer(cls, buf, dtype=np.int64) -> "StatisticsCalculator":
+        """
+        CLASS METHOD: Zero-Copy Alternative Constructor
+        
+        Wraps an existing buffer (bytes, bytearray, memoryview, mmap, ...)
+        holding packed native-endian integers. Nothing is copied, converted
+        or sorted, so construction is O(1) regardless of size.
+        
+        Zero-copy contract:
+        - The calculator shares memory with buf and keeps it alive
+        - The data is read-only through the calculator, but if buf itself
+          is mutable, changing it afterwards changes the results
+        - Median and mode sort (or partition) on every call, since no
+          sorted copy is kept, and no result is cached, so every statistic
+          always reflects the buffer's current contents
+        
+        Args:
+            buf: Object exposing the buffer protocol
+            dtype: Element type of buf: np.int16, np.int32 or np.int64
+            
+        Returns:
+            StatisticsCalculator viewing buf as its dataset
+            
+        Raises:
+            ValueError: If dtype is not a supported native integer type, or
+                the buffer size is not a multiple of the element size
+        """
+        if np.dtype(dtype) not in _SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype for from_buffer: {np.dtype(dtype)}")
+        
+        # BYPASS __init__: the constructor would copy through set_data
+        obj = cls.__new__(cls)
+        obj._data_arr = np.frombuffer(buf, dtype=dtype)
+        obj._data_arr.flags.writeable = False
+        obj._sorted_arr = None
+        obj._cache = {}
+        return obj
     
-    def get_data(self) -> List[int]:
+    def get_data(self) -> np.ndarray:
         """
         GETTER METHOD: Data Access Control
         
         Demonstrates OOP data protection:
         - Controlled read access to internal data
-        - Returns copy to prevent external modification
+        - Returns a read-only view instead of a copy (zero-copy access)
+          when the data is stored as int64
+        - Hides the narrow int16/int32 storage, whose arithmetic would wrap
+          in the caller's hands, behind a read-only int64 copy
         - Maintains object state integrity
         
         Returns:
-            Copy of the current dataset to prevent external modifications
+            Read-only int64 array holding the current dataset
             
         OOP Principle: DATA HIDING - provides controlled access to internal state
         """
-        # Return copy to maintain encapsulation and prevent external modification
-        return self._data.copy()
+        # READ-ONLY VIEW: views inherit the non-writeable flag of their base
+        if self._data_arr.dtype == np.int64:
+            return self._data_arr.view()
+        
+        # WIDENED COPY: the storage width stays an implementation detail
+        arr = self._data_arr.astype(np.int64)
+        arr.flags.writeable = False
+        return arr
+    
+    def to_list(self) -> List[int]:
+        """
+        CONVERSION METHOD: Plain Python List Export
+        
+        Returns:
+            New list of Python ints holding the current dataset
+        """
+        return self._data_arr.tolist()
     
     def calculate_mean(self, data: List[int] = None) -> float:
         """
@@ -111,15 +677,28 @@ class StatisticsCalculator:
         - Can work with both instance and external data
         - Consistent interface across all statistical methods
         """
-        # POLYMORPHIC BEHAVIOR: method works with different data sources
-        working_data = data if data is not None else self._data
+        # POLYMORPHIC BEHAVIOR: instance or caller data, resolved once;
+        # empty data is handled by the helper's @_empty_guard
+        arr, _ = self._resolve(data)
+        return self._mean_arr(arr)
+    
+    def calculate_summary(self, data: List[int] = None) -> dict:
+        """
+        INSTANCE METHOD: Single-Pass Summary Statistics
         
-        # EDGE CASE HANDLING: Graceful handling of empty data
-        if not working_data:
-            return 0.0
+        Demonstrates OOP delegation to a lower-level kernel:
+        - Fuses several reductions into one traversal of the data
+        - Hides the JIT/NumPy dispatch behind a plain method call
         
-        # ALGORITHM ENCAPSULATION: Mean calculation logic hidden in method
-        return sum(working_data) / len(working_data)
+        Args:
+            data: Optional data list. If not provided, uses instance data.
+            
+        Returns:
+            Dictionary with count, sum, mean, (population) variance, min
+            and max of the data
+        """
+        arr, _ = self._resolve(data)
+        return self._summary_arr(arr)
     
     def calculate_median(self, data: List[int] = None) -> float:
         """
@@ -141,33 +720,17 @@ class StatisticsCalculator:
         - Defines algorithm structure in method
         - Handles variations (even/odd length) internally
         """
-        working_data = data if data is not None else self._data
-        
-        if not working_data:
-            return 0.0
-        
-        # IMMUTABLE OPERATION: Creates new sorted list without modifying original
-        sorted_data = sorted(working_data)
-        n = len(sorted_data)
-        
-        # ALGORITHM ENCAPSULATION: Median logic encapsulated within method
-        if n % 2 == 0:
-            # Even number of elements - average of two middle values
-            mid1 = sorted_data[n // 2 - 1]
-            mid2 = sorted_data[n // 2]
-            return (mid1 + mid2) / 2.0
-        else:
-            # Odd number of elements - middle value
-            return float(sorted_data[n // 2])
+        arr, sorted_arr = self._resolve(data)
+        return self._median_arr(arr, sorted_arr)
     
-    def calculate_mode(self, data: List[int] = None) -> Tuple[List[int], int]:
+    def calculate_mode(self, data: List[int] = None) -> Tuple[Sequence[int], int]:
         """
         INSTANCE METHOD: Calculate Mode(s) - Most Complex Statistical Method
         
         Demonstrates advanced OOP principles:
         - Complex algorithm encapsulation
-        - Use of external libraries (Counter) showing COMPOSITION
-        - Returns complex data structure (tuple with list and int)
+        - Use of external libraries (NumPy) showing COMPOSITION
+        - Returns complex data structure (tuple of mode tuple and int)
         - Handles multiple modes elegantly
         - Consistent interface with other methods
         
@@ -176,40 +739,24 @@ class StatisticsCalculator:
             
         Returns:
             Tuple containing:
-            - List of mode values (sorted for consistency)
+            - Tuple of mode values (sorted for consistency)
             - Frequency of the mode(s)
             
         OOP Design Benefits:
         - Algorithm complexity hidden behind simple interface
-        - Leverages Python's standard library (composition over inheritance)
+        - Leverages NumPy (composition over inheritance)
         - Maintains consistent return patterns
         """
-        working_data = data if data is not None else self._data
-        
-        if not working_data:
-            return ([], 0)
-        
-        # COMPOSITION: Using Counter class from collections module
-        # Demonstrates OOP principle of using existing objects
-        frequency_counter = Counter(working_data)
-        
-        # ENCAPSULATED ALGORITHM: Mode finding logic within method
-        max_frequency = max(frequency_counter.values())
-        
-        # LIST COMPREHENSION: Pythonic approach to filtering and extracting
-        modes = [value for value, freq in frequency_counter.items() 
-                if freq == max_frequency]
-        
-        # Return sorted modes for consistent output
-        return (sorted(modes), max_frequency)
+        arr, sorted_arr = self._resolve(data)
+        return self._mode_arr(arr, sorted_arr)
     
-    def calculate_all_statistics(self, data: List[int] = None) -> dict:
+    def calculate_all_statistics(self, data: List[int] = None) -> Stats:
         """
         AGGREGATE METHOD: Comprehensive Statistics Calculation
         
         Demonstrates OOP composition and method coordination:
         - Orchestrates multiple methods within the class
-        - Returns structured data (dictionary)
+        - Returns structured data (immutable Stats value object)
         - Shows how OOP methods can call other methods
         - Provides convenient single-call interface
         
@@ -217,31 +764,15 @@ class StatisticsCalculator:
             data: Optional data list. If not provided, uses instance data.
             
         Returns:
-            Dictionary containing all calculated statistics and metadata
+            Stats tuple containing all calculated statistics and metadata
             
         OOP Pattern: FACADE
         - Provides simplified interface to complex subsystem
         - Coordinates multiple method calls
         - Returns comprehensive result structure
         """
-        working_data = data if data is not None else self._data
-        
-        if not working_data:
-            return {
-                'mean': 0.0,
-                'median': 0.0,
-                'mode': ([], 0),
-                'data_size': 0
-            }
-        
-        # METHOD COORDINATION: Calling other instance methods
-        # Demonstrates how OOP methods can collaborate
-        return {
-            'mean': self.calculate_mean(working_data),
-            'median': self.calculate_median(working_data), 
-            'mode': self.calculate_mode(working_data),
-            'data_size': len(working_data)
-        }
+        arr, sorted_arr = self._resolve(data)
+        return self._all_statistics_arr(arr, sorted_arr)
     
     def print_statistics(self, data: List[int] = None) -> None:
         """
@@ -261,31 +792,232 @@ class StatisticsCalculator:
         - Coordinates with other methods to gather data
         - Handles complex formatting logic internally
         """
-        working_data = data if data is not None else self._data
-        
-        print(f"Array: {working_data}")
+        working_data = data if data is not None else self.to_list()
         
-        if not working_data:
-            print("Cannot calculate statistics for empty array.")
-            print()
-            return
+        # SINGLE COERCION: the array is built once and shared by every
+        # calculation below
+        arr, sorted_arr = self._resolve(data)
         
         # METHOD COORDINATION: Using other instance methods
         # Demonstrates OOP principle of method collaboration
-        stats = self.calculate_all_statistics(working_data)
+        stats = self._all_statistics_arr(arr, sorted_arr) if arr.size else None
+        
+        # FORMATTED OUTPUT: whole report rendered from one template and
+        # handed to the stream in a single write
+        sys.stdout.write(self._format_report(working_data, stats))
+    
+    def calculate_batch_statistics(self, datasets: Sequence[List[int]]) -> List[Stats]:
+        """
+        BATCH METHOD: Statistics for Many Datasets in One Call
+        
+        Demonstrates OOP delegation to a data-parallel kernel:
+        - Packs the datasets back to back into one flat array plus offsets,
+          so memory grows with the total size, not the longest dataset
+        - Processes every dataset in a single (multi-core) kernel call
+        - Falls back to one calculation per dataset without Numba JIT, or
+          when the batch is too small (PARALLEL_THRESHOLD values in total)
+          to repay the kernel's thread start-up and compilation
+        
+        Args:
+            datasets: Sequence of integer lists (empty lists allowed)
+            
+        Returns:
+            List of Stats, one per dataset, in input order
+            
+        Raises:
+            ValueError: If a dataset is None (there is no instance data to
+                fall back on per dataset) or is not integer-valued
+        """
+        if any(data is None for data in datasets):
+            raise ValueError("Batch datasets must be given explicitly, got None")
+        arrays = [self._resolve(data)[0] for data in datasets]
+        
+        if (_batch_kernel is None
+                or sum(arr.size for arr in arrays) <= self.PARALLEL_THRESHOLD):
+            return [self._all_statistics_arr(arr) for arr in arrays]
+        
+        # RAGGED LAYOUT: datasets concatenated, delimited by offsets; the
+        # mode buffer reuses them, as no dataset has more modes than values
+        lens = np.array([arr.size for arr in arrays], dtype=np.int64)
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum(lens, out=offsets[1:])
+        values = np.concatenate(arrays)
+        
+        means = np.zeros(len(arrays))
+        medians = np.zeros((len(arrays), 2), dtype=np.int64)
+        modes = np.empty_like(values)
+        nmodes = np.zeros_like(lens)
+        freqs = np.zeros_like(lens)
+        _batch_kernel(values, offsets, means, medians, modes, nmodes, freqs)
         
-        # FORMATTED OUTPUT: Encapsulated presentation logic
-        print(f"Mean: {stats['mean']:.2f}")
-        print(f"Median: {stats['median']:.2f}")
+        return [Stats(mean=float(means[i]),
+                      median=0.5 * (int(medians[i, 0]) + int(medians[i, 1])),
+                      modes=_mode_tuple(modes[offsets[i]:offsets[i] + nmodes[i]]),
+                      freq=int(freqs[i]),
+                      size=int(lens[i]))
+                for i in range(len(arrays))]
+    
+    def batch_print_statistics(self, datasets: Sequence[List[int]]) -> None:
+        """
+        OUTPUT METHOD: Formatted Display for Many Datasets
+        
+        Same output as calling print_statistics on each dataset in turn,
+        computed with calculate_batch_statistics and written in one go.
+        
+        Args:
+            datasets: Sequence of integer lists (empty lists allowed)
+        """
+        all_stats = self.calculate_batch_statistics(datasets)
+        sys.stdout.write("".join(
+            self._format_report(data, stats if stats.size else None)
+            for data, stats in zip(datasets, all_stats)))
+    
+    # ------------------------------------------------------------------
+    # PRIVATE HELPERS: operate on an already-coerced, non-empty integer array
+    # so callers holding one skip repeated conversion and empty checks.
+    # sorted_arr, when given, is the pre-sorted instance data. Results for
+    # the instance data are memoized in self._cache.
+    # ------------------------------------------------------------------
+    
+    def _resolve(self, data: List[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve the data argument shared by all public methods
+        
+        Returns:
+            Tuple (arr, sorted_arr): the instance arrays when data is None
+            (sorted_arr may be None for buffer-backed instances), otherwise
+            data coerced to a read-only int64 array and None
+            
+        Raises:
+            ValueError: If data is not integer-valued
+        """
+        # POLYMORPHIC BEHAVIOR: method works with different data sources,
+        # coerced to the read-only contiguous int64 layout the kernels are
+        # compiled for (a view, so the caller's array is left writeable)
+        if data is None:
+            return self._data_arr, self._sorted_arr
+        arr = _as_int64_array(data).view()
+        arr.flags.writeable = False
+        return arr, None
+    
+    def _format_report(self, data, stats: Stats = None) -> str:
+        """Render one print_statistics report; stats is None for empty data"""
+        if stats is None:
+            return self.EMPTY_REPORT_TEMPLATE.format(data=data)
         
         # COMPLEX FORMATTING: Handles different mode scenarios
-        modes, frequency = stats['mode']
+        modes, frequency = stats.modes, stats.freq
         if len(modes) == 1:
-            print(f"Mode: {modes[0]} (frequency: {frequency})")
+            mode_line = self.SINGLE_MODE_TEMPLATE.format(mode=modes[0], freq=frequency)
+        else:
+            mode_line = self.MULTI_MODE_TEMPLATE.format(modes=list(modes), freq=frequency)
+        
+        return self.REPORT_TEMPLATE.format(
+            data=data, mean=stats.mean, median=stats.median, mode=mode_line)
+    
+    @_empty_guard(lambda: {
+        'count': 0, 'sum': 0, 'mean': 0.0, 'variance': 0.0, 'min': 0, 'max': 0
+    })
+    @_instance_cache('summary', copy=dict)
+    def _summary_arr(self, arr: np.ndarray) -> dict:
+        """Single-pass summary dictionary of an integer array (zeros if empty)"""
+        n = arr.size
+        
+        # PARALLEL DISPATCH: thread start-up only pays off on large inputs
+        kernel = _par_summary if n > self.PARALLEL_THRESHOLD else _summary
+        total, mean, m2, lo, hi = kernel(arr)
+        
+        # OVERFLOW CHECK: the kernel's int64 sum is exact modulo 2**64, so it
+        # is the true sum whenever that fits in int64. The (non-wrapping)
+        # float mean shows whether it can; if not, recompute it exactly
+        # with Python ints.
+        if abs(float(mean)) * n < 2.0 ** 62:
+            total = int(total)
+        else:
+            total = sum(arr.tolist())
+        
+        return {
+            'count': n,
+            'sum': total,
+            'mean': total / n,
+            'variance': float(m2) / n,
+            'min': int(lo),
+            'max': int(hi)
+        }
+    
+    @_empty_guard(float)
+    @_instance_cache('mean')
+    def _mean_arr(self, arr: np.ndarray) -> float:
+        """Mean of an integer array (0.0 if empty)"""
+        # ALGORITHM ENCAPSULATION: reduction over a contiguous buffer instead
+        # of a Python-level walk over boxed ints. A plain float64 sum, not
+        # the fused summary kernel: its per-element Welford update and
+        # min/max tracking cost several times more than the mean needs
+        return float(_mean_impl(arr))
+    
+    @_empty_guard(float)
+    @_instance_cache('median')
+    def _median_arr(self, arr: np.ndarray,
+                    sorted_arr: np.ndarray = None) -> float:
+        """Median of an integer array (0.0 if empty)"""
+        # PRE-SORTED INSTANCE DATA: median is just one or two index lookups
+        if sorted_arr is not None:
+            n = sorted_arr.size
+            if n % 2 == 0:
+                return 0.5 * (int(sorted_arr[n // 2 - 1]) + int(sorted_arr[n // 2]))
+            return float(sorted_arr[n // 2])
+        
+        # SELECTION INSTEAD OF SORTING: partition-based kernel, O(n) average.
+        # The middle values are averaged here with exact Python ints
+        lo, hi = _median_impl(arr)
+        return 0.5 * (int(lo) + int(hi))
+    
+    @_empty_guard(lambda: ((), 0))
+    @_instance_cache('mode')
+    def _mode_arr(self, arr: np.ndarray,
+                  sorted_arr: np.ndarray = None) -> Tuple[Sequence[int], int]:
+        """Mode(s) and their frequency for an integer array (((), 0) if empty)"""
+        if sorted_arr is None:
+            # HISTOGRAM FOR SMALL RANGES: one direct-indexed counting pass
+            # plus a scan of the counts, no sorting or hashing. The range is
+            # also bounded by the data size so the histogram never dwarfs
+            # the input.
+            lo, hi = int(arr.min()), int(arr.max())
+            value_range = hi - lo
+            if value_range <= min(self.BINCOUNT_MAX_RANGE, 16 * arr.size):
+                counts = np.bincount(np.subtract(arr, lo, dtype=np.intp))
+                max_frequency = counts.max()
+                modes = np.flatnonzero(counts == max_frequency) + lo
+                return (_mode_tuple(modes), int(max_frequency))
+        
+        # PRE-SORTED INSTANCE DATA: reuse the ordering built in set_data
+        if sorted_arr is not None:
+            a = sorted_arr
         else:
-            print(f"Mode: {modes} (frequency: {frequency} each)")
+            a = np.sort(arr)
+            a.flags.writeable = False
         
-        print()
+        # ENCAPSULATED ALGORITHM: run-length scan over the sorted values;
+        # modes come back already in ascending order
+        modes, max_frequency = _mode_impl(a)
+        
+        return (_mode_tuple(modes), int(max_frequency))
+    
+    @_empty_guard(lambda: Stats(0.0, 0.0, (), 0, 0))
+    @_instance_cache('all')
+    def _all_statistics_arr(self, arr: np.ndarray,
+                            sorted_arr: np.ndarray = None) -> Stats:
+        """Stats for an integer array (all zero if empty)"""
+        # METHOD COORDINATION: Calling other instance methods
+        # Demonstrates how OOP methods can collaborate
+        modes, frequency = self._mode_arr(arr, sorted_arr)
+        return Stats(
+            mean=self._mean_arr(arr),
+            median=self._median_arr(arr, sorted_arr),
+            modes=modes,
+            freq=frequency,
+            size=arr.size
+        )
     
     def __str__(self) -> str:
         """
@@ -301,7 +1033,7 @@ class StatisticsCalculator:
             
         OOP Principle: POLYMORPHISM - implements Python's string protocol
         """
-        return f"StatisticsCalculator(data={self._data})"
+        return f"StatisticsCalculator(data={self.to_list()})"
     
     def __repr__(self) -> str:
         """
@@ -317,7 +1049,120 @@ class StatisticsCalculator:
             
         OOP Principle: INTROSPECTION - allows examination of object state
         """
-        return f"StatisticsCalculator(data={self._data}, size={len(self._data)})"
+        return f"StatisticsCalculator(data={self.to_list()}, size={self._data_arr.size})"
+
+
+class StreamingStatistics:
+    """
+    OBJECT-ORIENTED CLASS: Single-Pass Statistics over a Stream
+    
+    Companion to StatisticsCalculator for inputs too large to hold in
+    memory (files, generators). Values are consumed one at a time and never
+    stored:
+    - Mean and variance use Welford's online update: O(1) memory and
+      numerically stable
+    - Mode keeps a Counter of distinct values: O(unique values) memory
+    - Median needs the full dataset and is therefore not offered
+    
+    Attributes:
+        _count (int): Number of values seen so far
+        _mean (float): Running mean
+        _m2 (float): Running sum of squared deviations from the mean
+        _counter (Counter): Frequency of each distinct value
+    """
+    
+    def __init__(self):
+        """
+        CONSTRUCTOR METHOD: Empty Running State
+        """
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._counter = Counter()
+    
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[int]) -> "StreamingStatistics":
+        """
+        CLASS METHOD: Alternative Constructor from Any Iterable
+        
+        Args:
+            iterable: Integers to consume (lazily, in a single pass)
+            
+        Returns:
+            StreamingStatistics summarizing every value of the iterable
+        """
+        stats = cls()
+        stats.update(iterable)
+        return stats
+    
+    def push(self, value: int) -> None:
+        """
+        MUTATOR METHOD: Fold One Value into the Running State
+        
+        Args:
+            value: Next integer of the stream
+            
+        Raises:
+            ValueError: If value is not an integer (floats such as 1.5 are
+                rejected, as they are by StatisticsCalculator); the running
+                state is left unchanged
+        """
+        # INPUT VALIDATION: any int-like value (Python or NumPy integer) is
+        # accepted and normalized to a Python int
+        try:
+            value = operator.index(value)
+        except TypeError:
+            raise ValueError(f"Statistics require integer data, got {value!r}") from None
+        
+        # WELFORD'S UPDATE: shift the mean by this value's share of its
+        # deviation, then accumulate the product of old and new deviations
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._counter[value] += 1
+    
+    def update(self, iterable: Iterable[int]) -> None:
+        """
+        MUTATOR METHOD: Fold Every Value of an Iterable into the State
+        
+        Args:
+            iterable: Integers to consume
+        """
+        for value in iterable:
+            self.push(value)
+    
+    @property
+    def count(self) -> int:
+        """Number of values seen so far"""
+        return self._count
+    
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of the values seen so far (0.0 if none)"""
+        return self._mean
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far (0.0 if none)"""
+        return self._m2 / self._count if self._count else 0.0
+    
+    @property
+    def mode(self) -> Tuple[Sequence[int], int]:
+        """Mode(s) in ascending order and their frequency (((), 0) if none)"""
+        if not self._counter:
+            return ((), 0)
+        max_frequency = max(self._counter.values())
+        modes = [value for value, freq in self._counter.items()
+                 if freq == max_frequency]
+        return (tuple(sorted(modes)), max_frequency)
+    
+    def __repr__(self) -> str:
+        """
+        SPECIAL METHOD: Developer Representation (OOP Protocol)
+        """
+        return (f"StreamingStatistics(count={self._count}, "
+                f"mean={self._mean}, variance={self.variance})")
 
 
 def main():
@@ -346,23 +1191,21 @@ def main():
     
     # Test case 1: Normal case with single mode
     test1 = [1, 2, 3, 4, 5, 5, 5]
-    calculator.print_statistics(test1)  # Method call with external data
     
     # Test case 2: Multiple modes scenario
     test2 = [1, 1, 2, 2, 3, 3]
-    calculator.print_statistics(test2)
     
     # Test case 3: Single element edge case
     test3 = [42]
-    calculator.print_statistics(test3)
     
     # Test case 4: Even number of elements for median
     test4 = [1, 2, 3, 4]
-    calculator.print_statistics(test4)
     
     # Test case 5: Empty list boundary condition
     test5 = []
-    calculator.print_statistics(test5)
+    
+    # BATCH PROCESSING: all test cases computed in one call with external data
+    calculator.batch_print_statistics([test1, test2, test3, test4, test5])
     
     # USAGE PATTERN 2: Object state management and instance methods
     # Demonstrates encapsulation and object lifecycle
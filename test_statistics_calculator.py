@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Regression Tests for the Python Statistics Calculator
+
+Checks the calculator against the standard library's statistics module on
+random data, both as normally imported (Numba kernels when installed) and
+in a copy of the module loaded with Numba hidden, so the pure NumPy fallback
+is always exercised; a third copy dispatches to a stand-in AOT kernel
+module. The batch kernel is checked the same way. Also pins down edge
+cases the vectorized code has to get right: empty input, values near the
+int64 limits and non-integer input.
+
+Run with: python3 -m unittest -v test_statistics_calculator
+"""
+
+import contextlib
+import importlib.util
+import io
+import inspect
+import random
+import statistics
+import sys
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import statistics_calculator
+
+
+def _load_variant(name: str, modules: dict):
+    """Fresh copy of statistics_calculator imported with sys.modules patched"""
+    with mock.patch.dict(sys.modules, modules):
+        spec = importlib.util.spec_from_file_location(
+            name, statistics_calculator.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def _load_numpy_fallback():
+    """Copy of statistics_calculator with Numba and the AOT kernels hidden"""
+    return _load_variant('statistics_calculator_fallback',
+                         {'numba': None, 'stats_kernels': None})
+
+
+def _fake_aot_kernels():
+    """
+    Stand-in for the built stats_kernels module: each export runs the JIT
+    kernel's Python source on int64 input (uncompiled, NumPy scalar
+    arithmetic would otherwise keep the narrow width and wrap). The int64
+    sum may wrap by design, as in the compiled kernel, so NumPy's overflow
+    warning is silenced.
+    """
+    def export(py_func):
+        def kernel(a):
+            with np.errstate(over='ignore'):
+                return py_func(a.astype(np.int64))
+        return kernel
+
+    kernels = types.ModuleType('stats_kernels')
+    for name in ('summary', 'mean', 'median', 'mode'):
+        py_func = getattr(statistics_calculator, f'_jit_{name}').py_func
+        for code in ('i2', 'i4', 'i8'):
+            setattr(kernels, f'{name}_{code}', export(py_func))
+    return kernels
+
+
+def _random_datasets(seed: int, count: int = 20) -> list:
+    """Random integer lists of varied size, range and sign"""
+    rng = random.Random(seed)
+    datasets = []
+    for _ in range(count):
+        size = rng.choice([1, 2, 3, 10, 101, 5000, 20000])
+        span = rng.choice([5, 1000, 2 ** 40])
+        datasets.append([rng.randint(-span, span) for _ in range(size)])
+    return datasets
+
+
+class ReferenceMixin:
+    """Comparison against the statistics module for one calculator module"""
+
+    module = statistics_calculator
+
+    def make_calculator(self):
+        return self.module.StatisticsCalculator()
+
+    def assert_mean_close(self, actual, data):
+        expected = statistics.mean(data)
+        self.assertAlmostEqual(actual, expected,
+                               delta=1e-9 * max(1, abs(expected)))
+
+    def assert_matches_reference(self, data, stats):
+        modes = sorted(statistics.multimode(data))
+        self.assert_mean_close(stats.mean, data)
+        self.assertEqual(stats.median, statistics.median(data))
+        self.assertEqual(stats.modes, tuple(modes))
+        self.assertEqual(stats.freq, data.count(modes[0]))
+        self.assertEqual(stats.size, len(data))
+
+    def test_mean_matches_statistics_module(self):
+        calc = self.make_calculator()
+        for data in _random_datasets(seed=1):
+            with self.subTest(size=len(data)):
+                self.assert_mean_close(calc.calculate_mean(data), data)
+                self.assert_mean_close(
+                    self.module.StatisticsCalculator(data).calculate_mean(), data)
+
+    def test_median_matches_statistics_module(self):
+        calc = self.make_calculator()
+        for data in _random_datasets(seed=2):
+            with self.subTest(size=len(data)):
+                self.assertEqual(calc.calculate_median(data),
+                                 statistics.median(data))
+                self.assertEqual(
+                    self.module.StatisticsCalculator(data).calculate_median(),
+                    statistics.median(data))
+
+    def test_median_beyond_float_precision(self):
+        # Middle values above 2**53 must not be rounded before averaging
+        calc = self.make_calculator()
+        rng = random.Random(11)
+        for data in ([2 ** 53 + 1, 2 ** 53 + 2], [2 ** 62 - 3, 2 ** 62 - 1],
+                     [rng.randrange(2 ** 53, 2 ** 53 + 64) for _ in range(1000)]):
+            with self.subTest(data=data[:2]):
+                expected = statistics.median(data)
+                self.assertEqual(calc.calculate_median(data), expected)
+                self.assertEqual(calc.calculate_all_statistics(data).median,
+                                 expected)
+                self.assertEqual(
+                    self.module.StatisticsCalculator(data).calculate_median(),
+                    expected)
+
+    def test_mode_matches_statistics_module(self):
+        calc = self.make_calculator()
+        for data in _random_datasets(seed=3):
+            with self.subTest(size=len(data)):
+                modes = sorted(statistics.multimode(data))
+                expected = (tuple(modes), data.count(modes[0]))
+                self.assertEqual(calc.calculate_mode(data), expected)
+                self.assertEqual(
+                    self.module.StatisticsCalculator(data).calculate_mode(),
+                    expected)
+
+    def test_mode_of_small_range_data(self):
+        # Unsorted input within BINCOUNT_MAX_RANGE is counted by histogram
+        calc = self.make_calculator()
+        rng = random.Random(8)
+        for span in (1, 50, 40000):
+            data = [rng.randint(-span, span) for _ in range(5000)]
+            with self.subTest(span=span):
+                modes = sorted(statistics.multimode(data))
+                self.assertEqual(calc.calculate_mode(data),
+                                 (tuple(modes), data.count(modes[0])))
+        buf = np.array([-32768, 32767, 32767], dtype=np.int16).tobytes()
+        calc = self.module.StatisticsCalculator.from_buffer(buf, np.int16)
+        self.assertEqual(calc.calculate_mode(), ((32767,), 2))
+
+    def test_all_statistics_match_statistics_module(self):
+        calc = self.make_calculator()
+        for data in _random_datasets(seed=9):
+            with self.subTest(size=len(data)):
+                self.assert_matches_reference(
+                    data, calc.calculate_all_statistics(data))
+                self.assert_matches_reference(
+                    data,
+                    self.module.StatisticsCalculator(data).calculate_all_statistics())
+
+    def test_summary_matches_statistics_module(self):
+        calc = self.make_calculator()
+        for data in _random_datasets(seed=4):
+            with self.subTest(size=len(data)):
+                summary = calc.calculate_summary(data)
+                self.assertEqual(summary['count'], len(data))
+                self.assertEqual(summary['sum'], sum(data))
+                self.assert_mean_close(summary['mean'], data)
+                self.assertEqual(summary['min'], min(data))
+                self.assertEqual(summary['max'], max(data))
+                expected = statistics.pvariance(data)
+                self.assertAlmostEqual(summary['variance'], expected,
+                                       delta=1e-9 * max(1, expected))
+
+    def test_parallel_summary_matches_statistics_module(self):
+        rng = random.Random(8)
+        data = [rng.randint(-2 ** 40, 2 ** 40) for _ in range(200000)]
+        summary = self.make_calculator().calculate_summary(data)
+        self.assertEqual(summary['count'], len(data))
+        self.assertEqual(summary['sum'], sum(data))
+        self.assertEqual(summary['min'], min(data))
+        self.assertEqual(summary['max'], max(data))
+        expected = float(np.var(np.array(data, dtype=np.float64)))
+        self.assertAlmostEqual(summary['variance'], expected,
+                               delta=1e-9 * expected)
+
+    def test_set_data_replaces_instance_data(self):
+        calc = self.module.StatisticsCalculator([3, 1, 2])
+        self.assertEqual(calc.calculate_median(), 2.0)
+        self.assertEqual(calc.calculate_mode(), ((1, 2, 3), 1))
+        calc.set_data([9, 7, 7, 8])
+        self.assertEqual(calc.calculate_mean(), 7.75)
+        self.assertEqual(calc.calculate_median(), 7.5)
+        self.assertEqual(calc.calculate_mode(), ((7,), 2))
+        self.assertEqual(calc.calculate_summary()['sum'], 31)
+
+    def test_instances_use_slots(self):
+        calc = self.module.StatisticsCalculator([1, 2, 3])
+        self.assertFalse(hasattr(calc, '__dict__'))
+        with self.assertRaises(AttributeError):
+            calc.data = [4, 5, 6]
+
+    def test_cached_results_are_not_shared(self):
+        calc = self.module.StatisticsCalculator([1, 1, 2] * 3000)
+        self.assertEqual(calc.calculate_all_statistics(),
+                         calc.calculate_all_statistics())
+        self.assertEqual(calc.calculate_mode(), ((1,), 6000))
+        calc.calculate_summary()['sum'] = -1
+        self.assertEqual(calc.calculate_summary()['sum'], 12000)
+
+    def test_get_data_is_read_only(self):
+        source = np.array([3, 1, 2])
+        calc = self.module.StatisticsCalculator(source)
+        source[0] = 100
+        data = calc.get_data()
+        self.assertFalse(data.flags.writeable)
+        with self.assertRaises(ValueError):
+            data[0] = 5
+        self.assertEqual(data.tolist(), [3, 1, 2])
+
+    def test_to_list(self):
+        calc = self.module.StatisticsCalculator([3, 1, 2])
+        values = calc.to_list()
+        self.assertEqual(values, [3, 1, 2])
+        self.assertIs(type(values[0]), int)
+        values.append(4)
+        self.assertEqual(calc.to_list(), [3, 1, 2])
+        self.assertEqual(self.module.StatisticsCalculator().to_list(), [])
+
+    def test_storage_uses_narrowest_dtype(self):
+        cases = [
+            ([], np.int64),
+            ([-2 ** 15, 2 ** 15 - 1], np.int16),
+            ([2 ** 15], np.int32),
+            ([-2 ** 31, 2 ** 31 - 1], np.int32),
+            ([-2 ** 31 - 1], np.int64),
+            ([2 ** 62, -(2 ** 62)], np.int64),
+        ]
+        for data, dtype in cases:
+            with self.subTest(data=data):
+                calc = self.module.StatisticsCalculator(data)
+                self.assertEqual(calc._data_arr.dtype, dtype)
+                self.assertEqual(calc.to_list(), data)
+                self.assertEqual(calc.get_data().tolist(), data)
+
+    def test_get_data_is_int64(self):
+        for data in ([300, 200], [2 ** 20, -7], [2 ** 40]):
+            with self.subTest(data=data):
+                values = self.module.StatisticsCalculator(data).get_data()
+                self.assertEqual(values.dtype, np.int64)
+                self.assertFalse(values.flags.writeable)
+                self.assertEqual((values * 200).tolist(), [x * 200 for x in data])
+        buf = np.array([300, 200], dtype=np.int16).tobytes()
+        values = self.module.StatisticsCalculator.from_buffer(buf, np.int16).get_data()
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual((values * 200).tolist(), [60000, 40000])
+
+    def test_narrow_storage_does_not_overflow(self):
+        data = [2 ** 15 - 1] * 5000 + [-2 ** 15] * 4999
+        calc = self.module.StatisticsCalculator(data)
+        self.assert_matches_reference(data, calc.calculate_all_statistics())
+        summary = calc.calculate_summary()
+        self.assertEqual(summary['sum'], sum(data))
+        self.assertEqual(self.module.StatisticsCalculator(
+            [2 ** 15 - 1, 2 ** 15 - 2]).calculate_median(), 32766.5)
+
+    def test_public_signature(self):
+        for name in ('calculate_mean', 'calculate_median', 'calculate_mode',
+                     'calculate_summary', 'calculate_all_statistics'):
+            with self.subTest(method=name):
+                method = getattr(self.module.StatisticsCalculator, name)
+                parameters = inspect.signature(method).parameters
+                self.assertEqual(list(parameters), ['self', 'data'])
+                self.assertIsNone(parameters['data'].default)
+
+    def test_from_buffer(self):
+        data = [5, -3, 5, 40000, 7]
+        for dtype in (np.int32, np.int64):
+            with self.subTest(dtype=dtype):
+                buf = np.array(data, dtype=dtype).tobytes()
+                calc = self.module.StatisticsCalculator.from_buffer(buf, dtype)
+                self.assertEqual(calc.to_list(), data)
+                self.assertFalse(calc.get_data().flags.writeable)
+                self.assert_matches_reference(data, calc.calculate_all_statistics())
+
+        calc = self.module.StatisticsCalculator.from_buffer(b'', np.int16)
+        self.assertEqual(calc.calculate_mean(), 0.0)
+        with self.assertRaises(ValueError):
+            self.module.StatisticsCalculator.from_buffer(b'\0' * 8, np.float64)
+        with self.assertRaises(ValueError):
+            self.module.StatisticsCalculator.from_buffer(b'\0' * 7)
+
+    def test_from_buffer_sees_buffer_changes(self):
+        buf = bytearray(np.array([1, 2, 3], dtype=np.int64).tobytes())
+        calc = self.module.StatisticsCalculator.from_buffer(buf)
+        self.assertEqual(calc.calculate_mean(), 2.0)
+        self.assertEqual(calc.calculate_median(), 2.0)
+        self.assertEqual(calc.calculate_mode(), ((1, 2, 3), 1))
+        self.assertEqual(calc.calculate_summary()['sum'], 6)
+
+        np.frombuffer(buf, dtype=np.int64)[:] = [10, 10, 40]
+        self.assertEqual(calc.calculate_mean(), 20.0)
+        self.assertEqual(calc.calculate_median(), 10.0)
+        self.assertEqual(calc.calculate_mode(), ((10,), 2))
+        self.assertEqual(calc.calculate_summary()['sum'], 60)
+        self.assertEqual(calc.calculate_all_statistics(),
+                         self.module.Stats(20.0, 10.0, (10,), 2, 3))
+
+    def test_int64_overflow_mean(self):
+        calc = self.make_calculator()
+        for size in (3, 5000, 100000):
+            data = [2 ** 62] * size
+            with self.subTest(size=size):
+                self.assertEqual(calc.calculate_mean(data), 2.0 ** 62)
+                summary = calc.calculate_summary(data)
+                self.assertEqual(summary['sum'], size * 2 ** 62)
+                self.assertEqual(summary['mean'], 2.0 ** 62)
+
+        # the wrapped int64 sum is still exact when the true sum fits
+        data = [2 ** 62, 2 ** 62, -(2 ** 62)]
+        self.assertEqual(calc.calculate_summary(data)['sum'], 2 ** 62)
+
+    def test_rejects_non_integer_data(self):
+        calc = self.make_calculator()
+        for data in ([1.5, 2.5], np.array([1.0, 2.0]), ['1', '2']):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    calc.calculate_mean(data)
+                with self.assertRaises(ValueError):
+                    self.module.StatisticsCalculator(data)
+
+    def test_rejects_values_beyond_int64(self):
+        calc = self.make_calculator()
+        for data in ([2 ** 63], [1, 2 ** 63 + 5],
+                     np.array([2 ** 63 + 5], dtype=np.uint64)):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    calc.calculate_mean(data)
+                with self.assertRaises(ValueError):
+                    self.module.StatisticsCalculator(data)
+        unsigned = np.array([2 ** 63 - 1, 1], dtype=np.uint64)
+        self.assertEqual(calc.calculate_median(unsigned), 2 ** 62)
+
+    def test_rejects_non_sequence_data(self):
+        calc = self.make_calculator()
+        for data in (5, np.int64(5), [[1, 2], [3, 4]], np.zeros((2, 2), np.int64)):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    calc.calculate_mean(data)
+                with self.assertRaises(ValueError):
+                    calc.calculate_all_statistics(data)
+                with self.assertRaises(ValueError):
+                    self.module.StatisticsCalculator(data)
+
+    def test_empty_data(self):
+        calc = self.make_calculator()
+        self.assertEqual(calc.calculate_mean([]), 0.0)
+        self.assertEqual(calc.calculate_mean(), 0.0)
+        self.assertEqual(calc.calculate_median([]), 0.0)
+        self.assertEqual(calc.calculate_median(), 0.0)
+        self.assertEqual(calc.calculate_mode([]), ((), 0))
+        self.assertEqual(calc.calculate_mode(), ((), 0))
+        self.assertEqual(calc.calculate_summary([])['count'], 0)
+        self.assertEqual(calc.calculate_all_statistics([]),
+                         self.module.Stats(0.0, 0.0, (), 0, 0))
+
+
+class DefaultImportTest(ReferenceMixin, unittest.TestCase):
+    """The module as imported normally: Numba kernels when installed"""
+
+
+class NumpyFallbackTest(ReferenceMixin, unittest.TestCase):
+    """Pure NumPy implementation used when Numba is not installed"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_numpy_fallback()
+
+    def test_numba_is_hidden(self):
+        self.assertFalse(self.module.NUMBA_AVAILABLE)
+        self.assertFalse(self.module.AOT_AVAILABLE)
+
+
+@unittest.skipUnless(statistics_calculator.NUMBA_AVAILABLE,
+                     "needs the JIT kernels' Python source")
+class AotDispatchTest(ReferenceMixin, unittest.TestCase):
+    """Dtype dispatch to an AOT stats_kernels module, with Numba absent"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_variant(
+            'statistics_calculator_aot',
+            {'numba': None, 'stats_kernels': _fake_aot_kernels()})
+
+    def test_aot_kernels_are_used(self):
+        self.assertTrue(self.module.AOT_AVAILABLE)
+        self.assertFalse(self.module.NUMBA_AVAILABLE)
+        self.assertEqual(self.module._mean_impl.__name__, '_mean_aot')
+        self.assertIs(self.module._par_summary, self.module._summary)
+
+
+class BatchPathTest(ReferenceMixin, unittest.TestCase):
+    """calculate_batch_statistics, forced onto the parallel batch kernel"""
+
+    def make_calculator(self):
+        class AlwaysBatch(self.module.StatisticsCalculator):
+            __slots__ = ()
+            PARALLEL_THRESHOLD = 0
+        return AlwaysBatch()
+
+    def test_batch_matches_statistics_module(self):
+        datasets = _random_datasets(seed=4) + [[]]
+        results = self.make_calculator().calculate_batch_statistics(datasets)
+        self.assertEqual(len(results), len(datasets))
+        for data, stats in zip(datasets, results):
+            with self.subTest(size=len(data)):
+                if data:
+                    self.assert_matches_reference(data, stats)
+                else:
+                    self.assertEqual(stats.size, 0)
+
+    def test_batch_overflow_mean(self):
+        datasets = [[2 ** 62] * 5000, [-(2 ** 62)] * 3, [1, 2]]
+        results = self.make_calculator().calculate_batch_statistics(datasets)
+        self.assertEqual([s.mean for s in results], [2.0 ** 62, -(2.0 ** 62), 1.5])
+
+    def test_batch_median_beyond_float_precision(self):
+        datasets = [[2 ** 53 + 1, 2 ** 53 + 2], [2 ** 62 - 3, 7, 2 ** 62 - 1, 9]]
+        results = self.make_calculator().calculate_batch_statistics(datasets)
+        self.assertEqual([s.median for s in results],
+                         [statistics.median(data) for data in datasets])
+
+    def test_batch_of_uneven_sizes(self):
+        # One long dataset among many short ones, with empties in between
+        rng = random.Random(6)
+        datasets = [[rng.randint(-9, 9) for _ in range(rng.randint(0, 3))]
+                    for _ in range(200)]
+        datasets.insert(100, [rng.randint(-50, 50) for _ in range(30000)])
+        results = self.make_calculator().calculate_batch_statistics(datasets)
+        for data, stats in zip(datasets, results):
+            with self.subTest(size=len(data)):
+                if data:
+                    self.assert_matches_reference(data, stats)
+                else:
+                    self.assertEqual(stats, self.module.Stats(0.0, 0.0, (), 0, 0))
+
+    def test_batch_rejects_none(self):
+        for calc in (self.module.StatisticsCalculator([1, 2, 3]),
+                     self.make_calculator()):
+            with self.assertRaises(ValueError):
+                calc.calculate_batch_statistics([[1, 2], None])
+
+    def test_batch_matches_per_dataset(self):
+        datasets = _random_datasets(seed=5)
+        calc = self.make_calculator()
+        single = statistics_calculator.StatisticsCalculator()
+        for batch, data in zip(calc.calculate_batch_statistics(datasets), datasets):
+            expected = single.calculate_all_statistics(data)
+            self.assertEqual(batch.median, expected.median)
+            self.assertEqual(batch.modes, expected.modes)
+            self.assertEqual(batch.freq, expected.freq)
+            self.assertAlmostEqual(batch.mean, expected.mean,
+                                   delta=1e-9 * max(1, abs(expected.mean)))
+
+
+
+class StreamingStatisticsTest(unittest.TestCase):
+    """Single-pass companion class, checked against the statistics module"""
+
+    def test_matches_statistics_module(self):
+        for data in _random_datasets(seed=13, count=8):
+            with self.subTest(size=len(data)):
+                stream = statistics_calculator.StreamingStatistics.from_iterable(
+                    iter(data))
+                modes = sorted(statistics.multimode(data))
+                self.assertEqual(stream.count, len(data))
+                self.assertAlmostEqual(
+                    stream.mean, statistics.mean(data),
+                    delta=1e-9 * max(1, abs(statistics.mean(data))))
+                expected = statistics.pvariance(data)
+                self.assertAlmostEqual(stream.variance, expected,
+                                       delta=1e-9 * max(1, expected))
+                self.assertEqual(stream.mode, (tuple(modes), data.count(modes[0])))
+
+    def test_incremental_updates(self):
+        stream = statistics_calculator.StreamingStatistics()
+        stream.push(4)
+        stream.update(value for value in (2, 4, 6))
+        self.assertEqual(stream.count, 4)
+        self.assertEqual(stream.mean, 4.0)
+        self.assertEqual(stream.variance, 2.0)
+        self.assertEqual(stream.mode, ((4,), 2))
+
+    def test_empty_state(self):
+        stream = statistics_calculator.StreamingStatistics.from_iterable([])
+        self.assertEqual(stream.count, 0)
+        self.assertEqual(stream.mean, 0.0)
+        self.assertEqual(stream.variance, 0.0)
+        self.assertEqual(stream.mode, ((), 0))
+
+    def test_rejects_non_integer_values(self):
+        stream = statistics_calculator.StreamingStatistics.from_iterable([1, 3])
+        for value in (1.5, 2.0, '2', None):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    stream.push(value)
+        with self.assertRaises(ValueError):
+            stream.update([5, 0.5])
+        self.assertEqual(stream.count, 3)
+        self.assertEqual(stream.mean, 3.0)
+        self.assertEqual(stream.mode, ((1, 3, 5), 1))
+
+    def test_accepts_numpy_integers(self):
+        stream = statistics_calculator.StreamingStatistics.from_iterable(
+            np.array([2 ** 62, 2 ** 62, -5], dtype=np.int64))
+        self.assertEqual(stream.mode, ((2 ** 62,), 2))
+        self.assertIs(type(stream.mode[0][0]), int)
+        self.assertAlmostEqual(stream.mean, (2 ** 63 - 5) / 3,
+                               delta=1e-9 * 2 ** 62)
+
+
+class PrintStatisticsTest(unittest.TestCase):
+    """Report layout written by print_statistics"""
+
+    def render(self, calc, *args, method='print_statistics'):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            getattr(calc, method)(*args)
+        return out.getvalue()
+
+    def test_report_layout(self):
+        calc = statistics_calculator.StatisticsCalculator()
+        self.assertEqual(
+            self.render(calc, [1, 2, 3, 4, 5, 5, 5]),
+            "Array: [1, 2, 3, 4, 5, 5, 5]\nMean: 3.57\nMedian: 4.00\n"
+            "Mode: 5 (frequency: 3)\n\n")
+        self.assertEqual(
+            self.render(calc, [1, 1, 2, 2, 3, 3]),
+            "Array: [1, 1, 2, 2, 3, 3]\nMean: 2.00\nMedian: 2.00\n"
+            "Mode: [1, 2, 3] (frequency: 2 each)\n\n")
+        self.assertEqual(
+            self.render(calc, []),
+            "Array: []\nCannot calculate statistics for empty array.\n\n")
+
+    def test_instance_data_report(self):
+        calc = statistics_calculator.StatisticsCalculator([10, 20, 30, 20, 10])
+        self.assertEqual(
+            self.render(calc),
+            "Array: [10, 20, 30, 20, 10]\nMean: 18.00\nMedian: 20.00\n"
+            "Mode: [10, 20] (frequency: 2 each)\n\n")
+
+    def test_batch_report_matches_single_reports(self):
+        datasets = [[1, 2, 3, 4, 5, 5, 5], [], [7], [1, 1, 2, 2, 3, 3],
+                    [2 ** 40, -5, 2 ** 40]]
+        calc = statistics_calculator.StatisticsCalculator()
+        expected = ''.join(self.render(calc, data) for data in datasets)
+
+        class AlwaysBatch(statistics_calculator.StatisticsCalculator):
+            __slots__ = ()
+            PARALLEL_THRESHOLD = 0
+
+        for batch_calc in (calc, AlwaysBatch()):
+            with self.subTest(calculator=type(batch_calc).__name__):
+                self.assertEqual(
+                    self.render(batch_calc, datasets,
+                                method='batch_print_statistics'),
+                    expected)
+
+
+if __name__ == '__main__':
+    unittest.main()